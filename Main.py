@@ -8,7 +8,11 @@ import sys
 import os
 import shutil
 import json
+import re
+import fnmatch
+import stat as _stat
 import threading
+import concurrent.futures
 from pathlib import Path
 from functools import partial
 
@@ -16,16 +20,20 @@ from PySide6.QtWidgets import (
     QApplication, QMainWindow, QTreeView, QListView, QFileSystemModel,
     QSplitter, QVBoxLayout, QWidget, QLineEdit, QToolBar, QMenu, QMessageBox,
     QInputDialog, QFileDialog, QLabel, QPushButton, QListWidget, QListWidgetItem,
-    QStyle, QHBoxLayout, QSizePolicy, QFrame, QProgressBar, QAbstractItemView
+    QStyle, QHBoxLayout, QSizePolicy, QFrame, QProgressBar, QAbstractItemView,
+    QFileIconProvider, QDockWidget
 )
 from PySide6.QtGui import QAction, QIcon, QDrag, QCursor
-from PySide6.QtCore import Qt, QMimeData, QUrl, QSize, Signal, QObject
+from PySide6.QtCore import Qt, QMimeData, QUrl, QSize, Signal, QObject, QThread, QTimer
 
 # -----------------------------
 # Helpers
 # -----------------------------
 APP_NAME = "DesktopNest"
 FAVS_FILE = Path.home() / ".desktopnest_favorites.json"
+# parallel search helps on network/high-latency filesystems but can regress
+# on local SSDs, so it stays opt-in (set e.g. DESKTOPNEST_SEARCH_THREADS=8)
+SEARCH_THREADS = int(os.environ.get("DESKTOPNEST_SEARCH_THREADS", "1"))
 
 def load_favs():
     try:
@@ -36,29 +44,87 @@ def load_favs():
     return []
 
 def save_favs(favs):
+    # compact dump + write-to-temp-then-rename: a crash mid-write can no
+    # longer truncate the favorites file
     try:
-        FAVS_FILE.write_text(json.dumps(favs, indent=2), encoding="utf-8")
+        tmp = FAVS_FILE.with_suffix(".json.tmp")
+        data = json.dumps(favs, separators=(",", ":")).encode("utf-8")
+        fd = os.open(tmp, os.O_CREAT | os.O_TRUNC | os.O_WRONLY, 0o644)
+        try:
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, FAVS_FILE)
     except Exception:
         pass
 
-def safe_move(src, dst_folder):
-    """Déplace src (path) dans dst_folder. Gère collisions en ajoutant suffixe."""
+def safe_move(src, dst_folder, dst_dev=None):
+    """Déplace src (path) dans dst_folder. Gère collisions en ajoutant suffixe.
+
+    dst_dev, si fourni, évite de re-stat dst_folder à chaque appel (cas des
+    drops multi-fichiers vers le même dossier)."""
     name = os.path.basename(src)
     dst = os.path.join(dst_folder, name)
     base, ext = os.path.splitext(name)
     i = 1
-    while os.path.exists(dst):
-        dst = os.path.join(dst_folder, f"{base} ({i}){ext}")
-        i += 1
-    shutil.move(src, dst)
+    # probe with O_CREAT|O_EXCL: one syscall per candidate and the name is
+    # reserved atomically, unlike the stat-then-move TOCTOU of os.path.exists
+    while True:
+        try:
+            fd = os.open(dst, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+        except FileExistsError:
+            dst = os.path.join(dst_folder, f"{base} ({i}){ext}")
+            i += 1
+            continue
+        os.close(fd)
+        os.unlink(dst)
+        break
+    # same device: one rename syscall instead of shutil.move's stat+copy path
+    if dst_dev is None:
+        dst_dev = os.stat(dst_folder).st_dev
+    if os.stat(os.path.dirname(src) or ".").st_dev == dst_dev:
+        os.rename(src, dst)
+    else:
+        shutil.move(src, dst)
     return dst
 
+def open_with_default_app(path):
+    """Ouvre path avec l'application par défaut, sans shell ni attente."""
+    if sys.platform.startswith('win'):
+        os.startfile(path)
+        return
+    helper = 'open' if sys.platform.startswith('darwin') else 'xdg-open'
+    subprocess.Popen([helper, path],
+                     stdin=subprocess.DEVNULL,
+                     stdout=subprocess.DEVNULL,
+                     stderr=subprocess.DEVNULL,
+                     start_new_session=True)
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 def readable_size(n):
-    for unit in ['B','KB','MB','GB','TB']:
-        if n < 1024:
-            return f"{n:.0f}{unit}"
-        n /= 1024
-    return f"{n:.1f}PB"
+    # pick the unit from the bit length instead of looping divisions
+    if n < 1024:
+        return f"{n}B"
+    i = min((n.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{n / (1 << (10 * i)):.1f}{_SIZE_UNITS[i]}"
+
+# style sheets live at module scope so toggling doesn't rebuild the strings
+_DARK_QSS = """
+    QMainWindow { background: #0f1720; color: #e6eef6; }
+    QTreeView, QListView, QLabel, QLineEdit, QListWidget { background: #0b1220; color: #dfe9f2; }
+    QToolBar { background: #071226; }
+    QPushButton { background: #12263a; color: #e6eef6; border-radius:6px; padding:6px; }
+    QPushButton:hover { background: #1b3550; }
+"""
+_LIGHT_QSS = """
+    QMainWindow { background: #f8fafc; color: #0f1720; }
+    QTreeView, QListView, QLabel, QLineEdit, QListWidget { background: #ffffff; color: #0f1720; }
+    QToolBar { background: #ffffff; }
+    QPushButton { background: #f1f5f9; color: #0f1720; border-radius:6px; padding:6px; }
+    QPushButton:hover { background: #e2e8f0; }
+"""
 
 # -----------------------------
 # Custom Views with Drag/Drop
@@ -115,10 +181,11 @@ class FileListView(QListView):
                 else:
                     dest_folder = os.path.dirname(p)
             moved = []
+            dest_dev = os.stat(dest_folder).st_dev
             for url in e.mimeData().urls():
                 src = url.toLocalFile()
                 try:
-                    new = safe_move(src, dest_folder)
+                    new = safe_move(src, dest_folder, dst_dev=dest_dev)
                     moved.append(new)
                 except Exception as ex:
                     QMessageBox.warning(self, "Erreur déplacement", f"Impossible de déplacer {src}:\n{ex}")
@@ -137,25 +204,12 @@ class FileTreeView(QTreeView):
         self.setSelectionMode(QAbstractItemView.ExtendedSelection)
 
     def startDrag(self, supportedActions):
-        indexes = self.selectedIndexes()
-        if not indexes:
+        # one index per column per row: keep column 0 only
+        paths = {self.model().filePath(idx) for idx in self.selectedIndexes() if idx.column() == 0}
+        if not paths:
             return
         mime = QMimeData()
-        urls = []
-        # unique paths
-        paths = set()
-        for idx in indexes:
-            if idx.column() != 0: continue
-            src_path = self.model().filePath(self.model().index(idx.row(), 0, idx.parent()))
-            # above approach may duplicate; simpler:
-        # instead use selectedIndexes and for each get filePath
-        for idx in self.selectedIndexes():
-            if idx.column() == 0:
-                p = self.model().filePath(idx)
-                paths.add(p)
-        for p in paths:
-            urls.append(QUrl.fromLocalFile(p))
-        mime.setUrls(urls)
+        mime.setUrls([QUrl.fromLocalFile(p) for p in paths])
         drag = QDrag(self)
         drag.setMimeData(mime)
         drag.exec(Qt.MoveAction)
@@ -183,10 +237,11 @@ class FileTreeView(QTreeView):
                     dest_folder = p
                 else:
                     dest_folder = os.path.dirname(p)
+            dest_dev = os.stat(dest_folder).st_dev
             for url in e.mimeData().urls():
                 src = url.toLocalFile()
                 try:
-                    new = safe_move(src, dest_folder)
+                    new = safe_move(src, dest_folder, dst_dev=dest_dev)
                 except Exception as ex:
                     QMessageBox.warning(self, "Erreur déplacement", f"Impossible de déplacer {src}:\n{ex}")
             e.acceptProposedAction()
@@ -194,48 +249,163 @@ class FileTreeView(QTreeView):
         else:
             super().dropEvent(e)
 
+class NullIconProvider(QFileIconProvider):
+    """Provider inerte, branché pendant les resets de racine pour éviter la
+    rafale de lookups d'icônes."""
+    def icon(self, *args):
+        return QIcon()
+
 # -----------------------------
 # Worker for search (thread)
 # -----------------------------
 class SearchWorker(QObject):
     finished = Signal(list)
     progress = Signal(int)
+    batch = Signal(list)  # chunks of paths, emitted as the walk finds them
 
-    def __init__(self, root, query, limit=1000):
+    def __init__(self, root, query, limit=1000, threads=1):
         super().__init__()
         self.root = root
         self.query = query.lower()
+        # bytes form for the ASCII fast path in run()
+        self.query_b = self.query.encode('utf-8').lower()
         self.limit = limit
+        self.threads = threads
         self._stop = False
 
     def stop(self):
         self._stop = True
 
     def run(self):
+        if self.threads > 1:
+            self._run_parallel()
+            return
+        # extension query (".pdf"): one precompiled case-insensitive fnmatch
+        # regex replaces the per-name lowering; matching stays inside the
+        # scandir walk below so stop() keeps its per-entry latency (handing
+        # the loop to Path.rglob would only check _stop once per hit)
+        rx_match = None
+        if self.query.startswith('.') and '/' not in self.query:
+            pat = ''.join(f'[{c}]' if c in '*?[' else c for c in self.query)
+            rx_match = re.compile(fnmatch.translate('*' + pat + '*'), re.IGNORECASE).match
         results = []
         count = 0
-        for dirpath, dirnames, filenames in os.walk(self.root):
+        chunk = []
+        # scandir-based walk: avoids the extra stat calls and intermediate
+        # dirnames/filenames lists that os.walk builds per directory
+        stack = [self.root]
+        while stack:
             if self._stop: break
-            # search in dirs
-            for d in dirnames:
-                if self._stop: break
-                if self.query in d.lower():
-                    results.append(os.path.join(dirpath, d))
-                    count += 1
-                    if count % 20 == 0:
-                        self.progress.emit(count)
-                if count >= self.limit: break
-            # search in files
-            for f in filenames:
-                if self._stop: break
-                if self.query in f.lower():
-                    results.append(os.path.join(dirpath, f))
-                    count += 1
-                    if count % 20 == 0:
-                        self.progress.emit(count)
-                if count >= self.limit: break
-            if count >= self.limit: break
-        self.finished.emit(results)
+            dirpath = stack.pop()
+            try:
+                with os.scandir(dirpath) as it:
+                    for entry in it:
+                        if self._stop: break
+                        name = entry.name
+                        if rx_match is not None:
+                            hit = rx_match(name) is not None
+                        else:
+                            # most names on Linux are already lowercase: try
+                            # the raw name first and only lower when it can
+                            # differ; ASCII names then match on bytes to skip
+                            # a lowered str allocation
+                            hit = self.query in name
+                            if not hit and not name.islower():
+                                try:
+                                    hit = self.query_b in name.encode('ascii').lower()
+                                except UnicodeEncodeError:
+                                    hit = self.query in name.lower()
+                        if hit:
+                            results.append(entry.path)
+                            chunk.append(entry.path)
+                            count += 1
+                            if len(chunk) >= 64:
+                                self.batch.emit(chunk)
+                                chunk = []
+                            # emit every 256 hits: progress crosses the Qt
+                            # event loop, so keep it off the hot path
+                            if count & 0xff == 0:
+                                self.progress.emit(count)
+                            # per-hit, not per-entry: a single flat directory
+                            # must not blow past the cap
+                            if count >= self.limit:
+                                break
+                        try:
+                            # uses cached d_type, no stat on Linux/macOS
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                        except OSError:
+                            pass
+            except (PermissionError, OSError):
+                continue
+            if len(results) >= self.limit: break
+        if chunk:
+            self.batch.emit(chunk)
+        self.finished.emit(results[:self.limit])
+
+    def _run_parallel(self):
+        """Traversée parallèle (LIFO) pour les systèmes de fichiers réseau
+        où readdir/stat dominent la latence."""
+        results = []
+        cond = threading.Condition()
+        dirs = [self.root]
+        busy = 0
+
+        def worker():
+            nonlocal busy
+            while True:
+                with cond:
+                    while not dirs and busy:
+                        cond.wait()
+                    if not dirs:
+                        # no work left and every worker idle: all done
+                        cond.notify_all()
+                        return
+                    dirpath = dirs.pop()
+                    busy += 1
+                hits = []
+                sub = []
+                try:
+                    with os.scandir(dirpath) as it:
+                        for entry in it:
+                            if self._stop: break
+                            name = entry.name
+                            hit = self.query in name
+                            if not hit and not name.islower():
+                                try:
+                                    hit = self.query_b in name.encode('ascii').lower()
+                                except UnicodeEncodeError:
+                                    hit = self.query in name.lower()
+                            if hit:
+                                hits.append(entry.path)
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    sub.append(entry.path)
+                            except OSError:
+                                pass
+                except (PermissionError, OSError):
+                    pass
+                with cond:
+                    busy -= 1
+                    if hits:
+                        before = len(results)
+                        results.extend(hits)
+                        # stream only what fits under the cap; finished is
+                        # truncated the same way
+                        if before < self.limit:
+                            self.batch.emit(hits[:self.limit - before])
+                        if len(results) >> 8 != before >> 8:
+                            self.progress.emit(len(results))
+                    if self._stop or len(results) >= self.limit:
+                        dirs.clear()
+                    else:
+                        dirs.extend(sub)
+                    cond.notify_all()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.threads) as pool:
+            for _ in range(self.threads):
+                pool.submit(worker)
+        self.finished.emit(results[:self.limit])
 
 # -----------------------------
 # Main Window
@@ -247,6 +417,8 @@ class MainWindow(QMainWindow):
         self.resize(1280, 800)
         self.setWindowIcon(self.style().standardIcon(QStyle.SP_DesktopIcon))
         self.favs = load_favs()
+        # parallel set for O(1) membership tests; favs stays the ordered list
+        self.fav_set = set(self.favs)
 
         # Root default: home
         self.root_path = str(Path.home())
@@ -278,7 +450,7 @@ class MainWindow(QMainWindow):
         tb.addAction(act_new)
 
         act_refresh = QAction("Refresh", self)
-        act_refresh.triggered.connect(self.refresh_views)
+        act_refresh.triggered.connect(self.force_refresh)
         tb.addAction(act_refresh)
 
         act_root = QAction("Changer racine", self)
@@ -295,6 +467,10 @@ class MainWindow(QMainWindow):
 
         # Left: Tree
         self.model = QFileSystemModel()
+        # on_fs_changed relies on the model's watcher to pick up moves
+        self.model.setOption(QFileSystemModel.DontWatchForChanges, False)
+        self._null_icons = NullIconProvider()
+        self._real_icons = self.model.iconProvider()
         self.model.setRootPath(self.root_path)
 
         self.tree = FileTreeView(self)
@@ -361,40 +537,42 @@ class MainWindow(QMainWindow):
         self.tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.tree.customContextMenuRequested.connect(self.context_tree)
 
-        # Keep track of selection
-        self.list.selectionModel().selectionChanged.connect(self.on_selection_changed)
-        self.tree.selectionModel().selectionChanged.connect(self.on_selection_changed)
+        # Keep track of selection (one dedicated handler per view, so a click
+        # doesn't query both selection models twice)
+        self.list.selectionModel().selectionChanged.connect(self._on_list_sel)
+        self.tree.selectionModel().selectionChanged.connect(self._on_tree_sel)
+
+        # In-flight search state; see _stop_search for the teardown rules
+        self.search_worker = None
+        self.search_thread = None
+        self._search_dlg = None
+
+        # Search results dock: filled incrementally while a search runs
+        self.result_dock = QDockWidget("Résultats de recherche", self)
+        self.result_list = QListWidget()
+        self.result_list.itemDoubleClicked.connect(self.on_result_open)
+        self.result_dock.setWidget(self.result_list)
+        self.addDockWidget(Qt.BottomDockWidgetArea, self.result_dock)
+        self.result_dock.hide()
+
+        # Coalesce favorites writes: rapid additions end up as one disk write
+        self._fav_save_timer = QTimer(self)
+        self._fav_save_timer.setSingleShot(True)
+        self._fav_save_timer.setInterval(500)
+        self._fav_save_timer.timeout.connect(lambda: save_favs(self.favs))
+        QApplication.instance().aboutToQuit.connect(self.flush_favorites)
 
         # Load favorites
         self.load_favorites()
 
         # Simple style
-        self.apply_light_style()
+        self.setStyleSheet(_LIGHT_QSS)
 
     # -----------------------------
     # UI / Style
     # -----------------------------
-    def apply_dark_style(self):
-        self.setStyleSheet("""
-            QMainWindow { background: #0f1720; color: #e6eef6; }
-            QTreeView, QListView, QLabel, QLineEdit, QListWidget { background: #0b1220; color: #dfe9f2; }
-            QToolBar { background: #071226; }
-            QPushButton { background: #12263a; color: #e6eef6; border-radius:6px; padding:6px; }
-            QPushButton:hover { background: #1b3550; }
-        """)
-    def apply_light_style(self):
-        self.setStyleSheet("""
-            QMainWindow { background: #f8fafc; color: #0f1720; }
-            QTreeView, QListView, QLabel, QLineEdit, QListWidget { background: #ffffff; color: #0f1720; }
-            QToolBar { background: #ffffff; }
-            QPushButton { background: #f1f5f9; color: #0f1720; border-radius:6px; padding:6px; }
-            QPushButton:hover { background: #e2e8f0; }
-        """)
     def toggle_dark(self, checked):
-        if checked:
-            self.apply_dark_style()
-        else:
-            self.apply_light_style()
+        self.setStyleSheet(_DARK_QSS if checked else _LIGHT_QSS)
 
     # -----------------------------
     # Actions: tree/list interactions
@@ -408,46 +586,32 @@ class MainWindow(QMainWindow):
     def on_list_doubleclicked(self, index):
         path = self.model.filePath(index)
         if os.path.isdir(path):
-            self.list.setRootIndex(self.model.index(path))
-            # expand tree to show it
+            # one index lookup serves the list root and the tree expansion
             idx = self.model.index(path)
+            self.list.setRootIndex(idx)
             self.tree.setCurrentIndex(idx)
             self.tree.expand(idx)
         else:
             # open file with default app
             try:
-                if sys.platform.startswith('win'):
-                    os.startfile(path)
-                elif sys.platform.startswith('darwin'):
-                    subprocess.call(('open', path))
-                else:
-                    subprocess.call(('xdg-open', path))
+                open_with_default_app(path)
             except Exception as ex:
                 QMessageBox.warning(self, "Ouvrir fichier", f"Impossible d'ouvrir: {ex}")
         self.update_details_for_path(path)
 
-    def on_selection_changed(self, *a):
-        # prefer list selection if present
+    def _on_list_sel(self, *a):
         sel = self.list.selectionModel().selectedIndexes()
         if sel:
-            path = self.model.filePath(sel[0])
-            self.update_details_for_path(path)
+            self.update_details_for_path(self.model.filePath(sel[0]))
         else:
-            sel2 = self.tree.selectionModel().selectedIndexes()
-            if sel2:
-                path = self.model.filePath(sel2[0])
-                self.update_details_for_path(path)
-            else:
-                self.details.setText("Sélectionnez un élément")
+            self.details.setText("Sélectionnez un élément")
 
-    def update_details_for_path(self, path):
-        try:
-            st = os.stat(path)
-            t = "Dossier" if os.path.isdir(path) else "Fichier"
-            txt = f"<b>{os.path.basename(path)}</b><br>Type: {t}<br>Chemin: {path}<br>Taille: {readable_size(st.st_size) if not os.path.isdir(path) else '-'}<br>Modifié: {QApplication.instance().toNativeSeparators(str(Path(path).stat().st_mtime))}"
-            self.details.setText(txt)
-        except Exception:
-            self.details.setText(f"<b>{os.path.basename(path)}</b><br>Chemin: {path}")
+    def _on_tree_sel(self, *a):
+        sel = self.tree.selectionModel().selectedIndexes()
+        if sel:
+            self.update_details_for_path(self.model.filePath(sel[0]))
+        else:
+            self.details.setText("Sélectionnez un élément")
 
     def context_list(self, pos):
         idx = self.list.indexAt(pos)
@@ -541,16 +705,12 @@ class MainWindow(QMainWindow):
     def open_path(self, path):
         try:
             if os.path.isdir(path):
-                self.list.setRootIndex(self.model.index(path))
-                self.tree.setCurrentIndex(self.model.index(path))
-                self.tree.expand(self.model.index(path))
+                idx = self.model.index(path)
+                self.list.setRootIndex(idx)
+                self.tree.setCurrentIndex(idx)
+                self.tree.expand(idx)
             else:
-                if sys.platform.startswith('win'):
-                    os.startfile(path)
-                elif sys.platform.startswith('darwin'):
-                    os.system(f"open \"{path}\"")
-                else:
-                    os.system(f"xdg-open \"{path}\"")
+                open_with_default_app(path)
         except Exception as ex:
             QMessageBox.warning(self, "Ouvrir", str(ex))
 
@@ -558,16 +718,24 @@ class MainWindow(QMainWindow):
     # Favorites
     # -----------------------------
     def load_favorites(self):
+        # full rebuild: startup only; incremental changes patch the widget
         self.fav_list.clear()
         for p in self.favs:
             it = QListWidgetItem(p)
             self.fav_list.addItem(it)
 
     def add_favorite(self, path):
-        if path not in self.favs:
+        if path not in self.fav_set:
             self.favs.append(path)
+            self.fav_set.add(path)
+            self._fav_save_timer.start()
+            self.fav_list.addItem(QListWidgetItem(path))
+
+    def flush_favorites(self):
+        # final synchronous write at shutdown if a save is still pending
+        if self._fav_save_timer.isActive():
+            self._fav_save_timer.stop()
             save_favs(self.favs)
-            self.load_favorites()
 
     def add_favorite_current(self):
         # add currently selected
@@ -585,8 +753,9 @@ class MainWindow(QMainWindow):
         else:
             QMessageBox.warning(self, "Favoris", "Élément introuvable, suppression du favori")
             self.favs = [f for f in self.favs if f != path]
-            save_favs(self.favs)
-            self.load_favorites()
+            self.fav_set = set(self.favs)
+            self._fav_save_timer.start()
+            self.fav_list.takeItem(self.fav_list.row(item))
 
     # -----------------------------
     # Root & refresh
@@ -594,32 +763,76 @@ class MainWindow(QMainWindow):
     def change_root(self):
         folder = QFileDialog.getExistingDirectory(self, "Choisir racine", self.root_path)
         if folder:
+            # refresh_views does the actual re-root (and the icon-provider
+            # swap); setting the model root here would make its guard a no-op
             self.root_path = folder
-            self.model.setRootPath(self.root_path)
-            self.tree.setRootIndex(self.model.index(self.root_path))
-            self.list.setRootIndex(self.model.index(self.root_path))
             self.refresh_views()
 
     def refresh_views(self):
-        # refresh model (QFileSystemModel doesn't provide a direct refresh method everywhere)
-        self.model.setRootPath(self.root_path)
-        current_list_root = self.list.rootIndex()
-        self.list.setRootIndex(self.model.index(self.model.filePath(current_list_root)))
-        self.tree.setRootIndex(self.model.index(self.root_path))
-        self.load_favorites()
+        # re-root the model only when the root actually changed; a root reset
+        # re-fetches icons for the whole current folder
+        if self.model.rootPath() != self.root_path:
+            # inert icons during the reset; the real provider comes back on
+            # the next event-loop turn, once the storm of dataChanged is over
+            list_path = self.model.filePath(self.list.rootIndex())
+            self.model.setIconProvider(self._null_icons)
+            self.model.setRootPath(self.root_path)
+            root_idx = self.model.index(self.root_path)
+            self.tree.setRootIndex(root_idx)
+            # keep the list on its current folder only if it lives under the
+            # (possibly new) root
+            if list_path and (list_path == self.root_path
+                              or list_path.startswith(self.root_path.rstrip(os.sep) + os.sep)):
+                self.list.setRootIndex(self.model.index(list_path))
+            else:
+                self.list.setRootIndex(root_idx)
+            QTimer.singleShot(0, lambda: self.model.setIconProvider(self._real_icons))
+
+    def force_refresh(self):
+        # explicit toolbar Refresh: QFileSystemModel ignores setRootPath to
+        # its current root, so bounce the root through "" to force a re-read
+        # when the watcher missed changes
+        self.model.setRootPath("")
+        self.refresh_views()
 
     def on_fs_changed(self):
-        # called after drag/drop moves to refresh
-        self.refresh_views()
+        # called once per drop batch; the model watches the filesystem, so a
+        # layout nudge is enough -- no need to reassign root indexes
+        self.model.layoutChanged.emit()
 
     # -----------------------------
     # Search
     # -----------------------------
+    def _stop_search(self):
+        """Arrête proprement la recherche en cours, s'il y en a une.
+
+        Rebinding search_worker while its thread is still inside run() would
+        drop the only Python reference and let Shiboken delete a live QObject;
+        the thread must be quit and joined first."""
+        if self.search_worker is not None:
+            self.search_worker.stop()
+            # late batches must not land in the next search's result list
+            self.search_worker.batch.disconnect(self.on_search_batch)
+            self.search_worker.finished.disconnect(self.on_search_results)
+        if self.search_thread is not None:
+            self.search_thread.quit()
+            self.search_thread.wait()
+            self.search_thread = None
+        self.search_worker = None
+        if self._search_dlg is not None:
+            self._search_dlg.close()
+            self._search_dlg = None
+
+    def closeEvent(self, event):
+        self._stop_search()
+        super().closeEvent(event)
+
     def on_search(self):
         q = self.search_input.text().strip()
         if not q:
             QMessageBox.information(self, "Recherche", "Entrez un terme de recherche.")
             return
+        self._stop_search()
         # Run threaded search to avoid freeze
         dlg = QProgressBar()
         dlg.setRange(0, 0)
@@ -628,53 +841,54 @@ class MainWindow(QMainWindow):
         dlg.setMinimumWidth(300)
         dlg.setWindowTitle("Recherche")
         dlg.show()
+        self._search_dlg = dlg
+
+        self.result_list.clear()
+        self.result_dock.setWindowTitle("Résultats de recherche")
+        self.result_dock.show()
+
+        # worker runs on a QThread; finished is queued back onto the GUI
+        # thread so widget updates never happen from the worker thread
+        self.search_worker = SearchWorker(self.root_path, q, limit=2000, threads=SEARCH_THREADS)
+        self.search_thread = QThread(self)
+        self.search_worker.moveToThread(self.search_thread)
+        self.search_thread.started.connect(self.search_worker.run)
+        self.search_worker.batch.connect(self.on_search_batch, Qt.QueuedConnection)
+        self.search_worker.finished.connect(self.on_search_results, Qt.QueuedConnection)
+        self.search_worker.finished.connect(self.search_thread.quit)
+        self.search_thread.start()
+
+    def on_search_batch(self, paths):
+        # results stream in while the walk is still running
+        for p in paths:
+            it = QListWidgetItem(os.path.basename(p))
+            it.setToolTip(p)
+            it.setData(Qt.UserRole, p)
+            self.result_list.addItem(it)
+
+    def on_search_results(self, results):
+        self._search_dlg.close()
+        if not results:
+            QMessageBox.information(self, "Recherche", "Aucun résultat.")
+            self.result_dock.hide()
+            return
+        self.result_dock.setWindowTitle(f"Résultats de recherche ({len(results)})")
 
-        results_holder = []
-        def finished(results):
-            dlg.close()
-            # show results in a simple dialog (replacing list content)
-            if not results:
-                QMessageBox.information(self, "Recherche", "Aucun résultat.")
-                return
-            # create a temp model showing results (we will populate list as plain items)
-            self.list.setModel(None)
-            self.list.clear()
-            # use QListWidget-like behavior: show icons + names
-            lw = QListWidget()
-            for p in results:
-                it = QListWidgetItem(os.path.basename(p))
-                it.setToolTip(p)
-                it.setData(Qt.UserRole, p)
-                lw.addItem(it)
-            # replace list with lw temporarily inside center widget
-            parent = self.list.parent()
-            splitter = self.list.parent().parent().findChild(QSplitter)
-            # easier approach: open a result dialog
-            dlg2 = QMessageBox(self)
-            dlg2.setWindowTitle("Résultats de recherche")
-            text = "\n".join(results[:200])  # limit printing
-            dlg2.setText(f"{len(results)} résultats (affichés: {min(len(results),200)})\n\nVoir chemins dans le terminal.")
-            dlg2.exec()
-            print("Search results (first 500):")
-            for p in results[:500]:
-                print(p)
-
-        def worker():
-            sw = SearchWorker(self.root_path, q, limit=2000)
-            sw.finished.connect(finished)
-            sw.run()
-
-        t = threading.Thread(target=worker, daemon=True)
-        t.start()
+    def on_result_open(self, item):
+        path = item.data(Qt.UserRole)
+        if path:
+            self.open_path(path)
 
     # -----------------------------
     # Utilities
     # -----------------------------
     def update_details_for_path(self, path):
         try:
+            # one stat per selection; isdir/isfile would each stat again
             st = os.stat(path)
-            t = "Dossier" if os.path.isdir(path) else "Fichier"
-            size = readable_size(st.st_size) if os.path.isfile(path) else "-"
+            is_dir = _stat.S_ISDIR(st.st_mode)
+            t = "Dossier" if is_dir else "Fichier"
+            size = "-" if is_dir else readable_size(st.st_size)
             txt = f"<b>{os.path.basename(path)}</b><br>Type: {t}<br>Chemin: {path}<br>Taille: {size}"
             self.details.setText(txt)
         except Exception: